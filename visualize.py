@@ -10,271 +10,647 @@ Usage:
 If no path is provided, uses: output/sets_20251017_clean.csv
 
 Requirements:
-    pip install pandas plotly
+    pip install pandas numpy plotly pyarrow orjson
+    pip install numba  # optional, parallelizes the per-exercise volume sum
 """
 
 import sys
 import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from pandas.api.types import union_categoricals
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+
+
+SETS_COLUMNS = ['session_id', 'exercise_name', 'reps', 'weight']
+SETS_DTYPES = {
+    'session_id': 'category',
+    'exercise_name': 'category',
+    'reps': 'float32',
+    'weight': 'float32',
+}
+
+# Sets files above this size are parsed in chunks of CSV_CHUNK_ROWS rows
+CHUNKED_READ_BYTES = 256 * 1024 * 1024
+CSV_CHUNK_ROWS = 200_000
+
+# Below this many sets, the two np.bincount passes finish before a fresh
+# process has imported numba and loaded the cached kernel (~0.3 s); the
+# first-ever compile costs seconds more and is only repaid far above this
+NUMBA_MIN_ROWS = 25_000_000
+
+# Per-set columns as NumPy arrays, plus the exercise/session categories
+# their codes index into
+SetArrays = namedtuple('SetArrays', 'ex_codes ex_cats sess_codes sess_cats reps weight volume date')
+
+# Days from numpy's Thursday-aligned week boundary to the following Monday
+WEEK_START_OFFSET = np.timedelta64(4, 'D')
+
+# Summary dashboard limits on how many points are sent to the browser
+WEIGHT_BINS = 30
+MAX_DAILY_POINTS = 365
+
+# Characters of HTML encoded and written per chunk
+WRITE_CHUNK_SIZE = 1 << 20
+
+# Serialize figure JSON with orjson rather than the stdlib encoder
+pio.json.config.default_engine = 'orjson'
+
+# Figures are written as plain dicts, so apply the default theme explicitly
+DEFAULT_TEMPLATE = pio.templates[pio.templates.default].to_plotly_json()
+
+
+def union_chunk_categoricals(pieces):
+    """Merge per-chunk Categoricals whose categories may differ in dtype."""
+    # An all-blank chunk infers empty float64 categories, and a chunk of purely
+    # numeric IDs infers integer ones; union_categoricals needs them to match
+    typed = [piece for piece in pieces if len(piece.categories)]
+    if not typed:
+        return union_categoricals(pieces)
+
+    # Mixed numeric and text IDs read as text, as the pyarrow path does
+    as_text = len({piece.categories.dtype for piece in typed}) > 1
+    empty_categories = typed[0].categories[:0]
+    if as_text:
+        empty_categories = empty_categories.astype(str)
+
+    merged = []
+    for piece in pieces:
+        if not len(piece.categories):
+            piece = pd.Categorical.from_codes(piece.codes, dtype=pd.CategoricalDtype(empty_categories))
+        elif as_text:
+            piece = piece.rename_categories(piece.categories.astype(str))
+        merged.append(piece)
+    return union_categoricals(merged)
+
+
+def read_sets_csv(sets_path):
+    """Parse the sets CSV, streaming it in chunks when the file is large."""
+    # Only read the columns the charts use, straight into narrow dtypes
+    if sets_path.stat().st_size <= CHUNKED_READ_BYTES:
+        # pandas' pyarrow engine can't allow newlines inside quoted cells
+        # (the exporter writes multi-line notes), so call pyarrow directly
+        table = pa_csv.read_csv(
+            sets_path,
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=SETS_COLUMNS,
+                column_types={'reps': pa.float32(), 'weight': pa.float32()},
+                strings_can_be_null=True
+            )
+        )
+        return table.to_pandas().astype(SETS_DTYPES)
+
+    # The pyarrow engine holds the whole Arrow table alongside the result, so
+    # large files go through the C parser a chunk at a time and only the
+    # compact per-chunk columns are kept
+    numeric_dtypes = {column: dtype for column, dtype in SETS_DTYPES.items() if dtype != 'category'}
+    pieces = {column: [] for column in SETS_COLUMNS}
+    for chunk in pd.read_csv(
+        sets_path,
+        chunksize=CSV_CHUNK_ROWS,
+        usecols=SETS_COLUMNS,
+        dtype=numeric_dtypes
+    ):
+        # Keep each column's compact piece and drop the parsed chunk, so no
+        # full-size copy of the frame is held while the columns are merged
+        for column in SETS_COLUMNS:
+            values = chunk.pop(column)
+            if SETS_DTYPES[column] == 'category':
+                # Categorize after parsing: asking the C parser for 'category'
+                # always yields string categories, while the pyarrow path and
+                # the workouts read keep numeric session IDs as integers
+                pieces[column].append(values.astype('category').array)
+            else:
+                pieces[column].append(values.to_numpy())
+
+    # Each chunk has its own categories, so merge them rather than letting
+    # concat fall back to object columns; one column is merged at a time
+    columns = {}
+    for column in SETS_COLUMNS:
+        column_pieces = pieces.pop(column)
+        if SETS_DTYPES[column] == 'category':
+            columns[column] = union_chunk_categoricals(column_pieces)
+        else:
+            columns[column] = np.concatenate(column_pieces)
+        del column_pieces
+
+    # The merged columns are already fresh arrays, so don't copy them again
+    return pd.DataFrame(columns, copy=False)
+
+
+def read_sets(sets_path):
+    """Read the sets CSV, reusing a Parquet copy next to it when up to date."""
+    cache_path = sets_path.with_suffix('.parquet')
+
+    if cache_path.exists() and cache_path.stat().st_mtime >= sets_path.stat().st_mtime:
+        try:
+            # An empty categorical is stored as a null column, so restore the dtypes
+            return pd.read_parquet(cache_path, columns=SETS_COLUMNS).astype(SETS_DTYPES)
+        except (OSError, pa.ArrowException) as e:
+            print(f"Warning: Ignoring unreadable Parquet cache {cache_path}: {e}")
+
+    sets_df = read_sets_csv(sets_path)
+
+    # Write beside the cache and rename into place, so an interrupted run
+    # never leaves a truncated cache that looks up to date
+    tmp_path = cache_path.with_name(f'.{cache_path.name}.{os.getpid()}.tmp')
+    try:
+        sets_df.to_parquet(tmp_path, compression='zstd', index=False)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: Could not write Parquet cache {cache_path}: {e}")
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    return sets_df
+
+
+def session_dates(workouts_df):
+    """Map each session_id to its session_date."""
+    return workouts_df.drop_duplicates('session_id').set_index('session_id')['session_date']
 
 
 def load_data(sets_path):
     """Load and prepare the workout data."""
     print(f"Loading data from {sets_path}...")
 
-    sets_df = pd.read_csv(sets_path)
+    sets_df = read_sets(Path(sets_path))
     print(f"Loaded {len(sets_df)} sets")
 
     # Try to load corresponding workouts file
     workouts_path = sets_path.replace("sets_", "workouts_").replace("_clean", "_20251017_113224")
 
     if os.path.exists(workouts_path):
-        workouts_df = pd.read_csv(workouts_path)
+        # Small file with multi-line quoted notes, so the C parser is the safe choice
+        workouts_df = pd.read_csv(
+            workouts_path,
+            usecols=['session_id', 'session_date'],
+            parse_dates=['session_date']
+        )
         print(f"Loaded {len(workouts_df)} workouts")
 
-        # Parse dates
-        workouts_df['session_date'] = pd.to_datetime(workouts_df['session_date'])
-
-        # Merge session dates into sets
-        sets_df = sets_df.merge(
-            workouts_df[['session_id', 'session_date']],
-            on='session_id',
-            how='left'
-        )
+        # Look up each session's date once, then spread it to the sets
+        # through the category codes (-1 codes have no session)
+        session_ids = sets_df['session_id'].cat
+        dates = pd.to_datetime(session_dates(workouts_df).reindex(session_ids.categories)).to_numpy()
+        codes = session_ids.codes.to_numpy()
+        set_dates = np.full(len(codes), np.datetime64('NaT'), dtype=dates.dtype)
+        set_dates[codes >= 0] = dates[codes[codes >= 0]]
+        sets_df['session_date'] = set_dates
     else:
         print(f"Warning: Workouts file not found at {workouts_path}")
         print("Time-based visualizations will be skipped.")
         workouts_df = None
 
-    # Convert numeric columns
-    sets_df['reps'] = pd.to_numeric(sets_df['reps'], errors='coerce').fillna(0)
-    sets_df['weight'] = pd.to_numeric(sets_df['weight'], errors='coerce').fillna(0)
+    # Blank reps/weight cells come through as NaN
+    sets_df[['reps', 'weight']] = sets_df[['reps', 'weight']].fillna(0)
 
-    # Calculate volume
-    sets_df['volume'] = sets_df['reps'] * sets_df['weight']
+    # Calculate volume on the raw float32 arrays (no index alignment)
+    reps = sets_df['reps'].to_numpy(dtype=np.float32, copy=False)
+    weight = sets_df['weight'].to_numpy(dtype=np.float32, copy=False)
+    sets_df['volume'] = np.multiply(reps, weight, dtype=np.float32)
 
     return sets_df, workouts_df
 
 
-def generate_top_exercises_by_volume(sets_df, output_dir):
-    """Generate bar chart of top 10 exercises by total volume."""
-    print("\n1. Generating top exercises by volume chart...")
+@lru_cache(maxsize=None)
+def load_numba_kernel():
+    """Import numba and compile the parallel sum kernel, or None without numba."""
+    try:
+        import numba
+        from numba import njit, prange
+    except ImportError:  # numba is optional
+        return None
+
+    # The chart workers are forked after this kernel runs, and workqueue is
+    # the threading layer that stays fork-safe on every platform; respect a
+    # layer the user has configured themselves
+    if numba.config.THREADING_LAYER == 'default':
+        numba.config.THREADING_LAYER = 'workqueue'
+
+    @njit(parallel=True, cache=True)
+    def sum_by_code_parallel(codes, values, ngroups, nthreads):
+        # Each thread sums its own slice into a private row, so no atomics are needed
+        step = (codes.shape[0] + nthreads - 1) // nthreads
+        partials = np.zeros((nthreads, ngroups), dtype=np.float64)
+        for t in prange(nthreads):
+            for i in range(t * step, min((t + 1) * step, codes.shape[0])):
+                if codes[i] >= 0:
+                    partials[t, codes[i]] += values[i]
+        return partials.sum(axis=0)
+
+    def sum_by_code_numba(codes, values, ngroups):
+        return sum_by_code_parallel(codes, values, ngroups, numba.get_num_threads())
+
+    return sum_by_code_numba
+
+
+def sum_by_code(codes, values, ngroups):
+    """Sum values per category code, skipping missing (-1) codes."""
+    # Importing numba and loading the kernel is a fixed cost per process,
+    # so it is only paid once an input is big enough to win it back
+    if codes.shape[0] >= NUMBA_MIN_ROWS:
+        kernel = load_numba_kernel()
+        if kernel is not None:
+            return kernel(codes, values, ngroups)
+
+    valid = codes >= 0
+    return np.bincount(codes[valid], weights=values[valid], minlength=ngroups)
+
+
+def set_arrays(sets_df):
+    """Pull the per-set columns the aggregations use out as plain NumPy arrays."""
+    exercise_names = sets_df['exercise_name'].cat
+    session_ids = sets_df['session_id'].cat
+
+    return SetArrays(
+        ex_codes=exercise_names.codes.to_numpy(),
+        ex_cats=exercise_names.categories,
+        sess_codes=session_ids.codes.to_numpy(),
+        sess_cats=session_ids.categories,
+        reps=sets_df['reps'].to_numpy(),
+        weight=sets_df['weight'].to_numpy(),
+        volume=sets_df['volume'].to_numpy(),
+        date=sets_df['session_date'].to_numpy() if 'session_date' in sets_df.columns else None
+    )
 
-    exercise_volume = sets_df.groupby('exercise_name')['volume'].sum().sort_values(ascending=False)
-    top_10 = exercise_volume.head(10)
 
-    fig = go.Figure(data=[
-        go.Bar(
-            x=top_10.index,
-            y=top_10.values,
-            marker_color='indianred'
-        )
-    ])
+def count_workouts_per_exercise(arrays):
+    """Count the distinct workouts each exercise appears in, by exercise code."""
+    n_sessions = len(arrays.sess_cats)
 
-    fig.update_layout(
-        title='Top 10 Exercises by Total Volume (reps × weight)',
-        xaxis_title='Exercise',
-        yaxis_title='Total Volume',
-        hovermode='x unified'
-    )
+    # Encode each (exercise, session) pair as one integer and count the
+    # unique pairs per exercise, instead of a hash-set-per-group nunique
+    valid = (arrays.ex_codes >= 0) & (arrays.sess_codes >= 0)
+    pairs = arrays.ex_codes[valid].astype(np.int64) * n_sessions + arrays.sess_codes[valid]
+    return np.bincount(np.unique(pairs) // n_sessions, minlength=len(arrays.ex_cats))
 
-    output_path = output_dir / 'top_exercises_by_volume.html'
-    fig.write_html(output_path)
-    print(f"   Saved: {output_path}")
+
+def aggregate_by_exercise(arrays):
+    """Compute the per-exercise totals shared by several charts in one pass."""
+    n_exercises = len(arrays.ex_cats)
+    valid = arrays.ex_codes >= 0
+    sets = np.bincount(arrays.ex_codes[valid], minlength=n_exercises)
+
+    per_exercise = pd.DataFrame({
+        'volume': sum_by_code(arrays.ex_codes, arrays.volume, n_exercises),
+        'avg_reps': sum_by_code(arrays.ex_codes, arrays.reps, n_exercises) / np.maximum(sets, 1),
+        'workouts': count_workouts_per_exercise(arrays)
+    }, index=arrays.ex_cats.rename('exercise_name'))
+
+    # Only keep exercises that actually have sets
+    return per_exercise[sets > 0]
 
 
-def generate_workout_frequency(workouts_df, output_dir):
-    """Generate chart showing workout frequency over time."""
-    print("2. Generating workout frequency chart...")
+def top_k_indices(values, k):
+    """Return the positions of the k largest values, largest first."""
+    k = min(k, values.size)
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
 
+    # Partial selection is O(n); only the k winners get sorted
+    top = np.argpartition(-values, k - 1)[:k]
+    return top[np.argsort(-values[top], kind='stable')]
+
+
+def aggregate_weekly_workouts(workouts_df):
+    """Count workouts per week, or None when no dates are available."""
     if workouts_df is None or 'session_date' not in workouts_df.columns:
-        print("   Skipped: No date information available")
-        return
-
-    # Group by week
-    workouts_df['week'] = workouts_df['session_date'].dt.to_period('W').astype(str)
-    weekly_counts = workouts_df.groupby('week').size().reset_index(name='count')
-
-    fig = go.Figure(data=[
-        go.Bar(
-            x=weekly_counts['week'],
-            y=weekly_counts['count'],
-            marker_color='lightseagreen'
-        )
-    ])
+        return None
 
-    fig.update_layout(
-        title='Workouts Per Week',
-        xaxis_title='Week',
-        yaxis_title='Number of Workouts',
-        hovermode='x unified'
-    )
+    dates = workouts_df['session_date'].to_numpy(dtype='datetime64[D]')
+    dates = dates[~np.isnat(dates)]
 
-    output_path = output_dir / 'workout_frequency.html'
-    fig.write_html(output_path)
-    print(f"   Saved: {output_path}")
+    # numpy weeks start on Thursday (the 1970 epoch); shift so they start on Monday
+    weeks = (dates - WEEK_START_OFFSET).astype('datetime64[W]') + WEEK_START_OFFSET
+    weeks, counts = np.unique(weeks, return_counts=True)
 
+    return pd.DataFrame({
+        'week': np.datetime_as_string(weeks, unit='D'),
+        'count': counts
+    })
 
-def generate_exercise_progression(sets_df, output_dir):
-    """Generate line chart showing volume progression for top 5 exercises."""
-    print("3. Generating exercise progression chart...")
 
-    if 'session_date' not in sets_df.columns:
-        print("   Skipped: No date information available")
-        return
+def aggregate_progression(arrays, per_exercise):
+    """Sum daily volume for the top 5 exercises, or None when no dates are available."""
+    if arrays.date is None:
+        return None
 
     # Find top 5 exercises by total volume
-    top_exercises = sets_df.groupby('exercise_name')['volume'].sum().nlargest(5).index
+    top_exercises = per_exercise.index[top_k_indices(per_exercise['volume'].to_numpy(), 5)]
 
-    # Filter to top exercises
-    top_df = sets_df[sets_df['exercise_name'].isin(top_exercises)].copy()
+    # Filter to top exercises by comparing category codes, not strings
+    top_codes = arrays.ex_cats.get_indexer(top_exercises)
+    mask = np.isin(arrays.ex_codes, top_codes)
+    top_df = pd.DataFrame({
+        'session_date': arrays.date[mask],
+        'exercise_name': pd.Categorical.from_codes(arrays.ex_codes[mask], categories=arrays.ex_cats),
+        'volume': arrays.volume[mask]
+    })
 
     # Group by exercise and date
-    progression = top_df.groupby(['session_date', 'exercise_name'])['volume'].sum().reset_index()
-
-    fig = px.line(
-        progression,
-        x='session_date',
-        y='volume',
-        color='exercise_name',
-        title='Exercise Volume Progression Over Time (Top 5 Exercises)',
-        labels={
-            'session_date': 'Date',
-            'volume': 'Volume (reps × weight)',
-            'exercise_name': 'Exercise'
-        }
-    )
+    return top_df.groupby(['session_date', 'exercise_name'], observed=True)['volume'].sum().reset_index()
 
-    fig.update_layout(hovermode='x unified')
 
-    output_path = output_dir / 'exercise_progression.html'
-    fig.write_html(output_path)
-    print(f"   Saved: {output_path}")
+def count_sets_per_workout(arrays):
+    """Count the sets logged in each workout, indexed by session_id."""
+    valid = arrays.sess_codes >= 0
+    counts = np.bincount(arrays.sess_codes[valid], minlength=len(arrays.sess_cats))
+    sets_per_workout = pd.Series(counts, index=arrays.sess_cats.rename('session_id'))
 
+    return sets_per_workout[counts > 0]
 
-def generate_sets_distribution(sets_df, output_dir):
-    """Generate histogram showing distribution of sets per workout."""
-    print("4. Generating sets distribution chart...")
 
-    sets_per_workout = sets_df.groupby('session_id').size()
+def aggregate_summary(arrays, workouts_df, per_exercise, sets_per_workout):
+    """Compute the totals, weight bins and daily set counts for the dashboard."""
+    total_workouts = len(sets_per_workout)
+    total_sets = len(arrays.volume)
 
-    fig = go.Figure(data=[
-        go.Histogram(
-            x=sets_per_workout.values,
-            marker_color='mediumpurple',
-            nbinsx=20
-        )
-    ])
+    # Weight distribution, binned here so only the bins are sent to the browser
+    # Bin in float64 so edges don't carry float32 noise into the hover labels
+    weights = arrays.weight[arrays.weight > 0].astype(np.float64)
+    weight_counts, weight_edges = np.histogram(weights, bins=WEIGHT_BINS)
 
-    fig.update_layout(
-        title='Distribution of Sets Per Workout',
-        xaxis_title='Number of Sets',
-        yaxis_title='Number of Workouts',
-        showlegend=False
-    )
+    daily_sets = None
+    if workouts_df is not None:
+        # Roll the per-workout set counts up by date rather than regrouping every set
+        dates = session_dates(workouts_df).reindex(np.asarray(sets_per_workout.index))
+        daily_sets = sets_per_workout.groupby(dates.to_numpy()).sum()
+        daily_sets = daily_sets.rename_axis('session_date').reset_index(name='count')
 
-    output_path = output_dir / 'sets_distribution.html'
-    fig.write_html(output_path)
-    print(f"   Saved: {output_path}")
+        # Roll long histories up to weekly totals to keep the point count small
+        if len(daily_sets) > MAX_DAILY_POINTS:
+            daily_sets = daily_sets.set_index('session_date').resample('W').sum().reset_index()
 
+    return {
+        'total_workouts': total_workouts,
+        'total_sets': total_sets,
+        'total_exercises': len(per_exercise),
+        'avg_sets_per_workout': total_sets / total_workouts if total_workouts > 0 else 0,
+        'weight_counts': weight_counts,
+        'weight_edges': weight_edges,
+        'daily_sets': daily_sets
+    }
 
-def generate_exercise_frequency(sets_df, output_dir):
-    """Generate bar chart showing top 15 most frequent exercises."""
-    print("5. Generating exercise frequency chart...")
 
-    # Count unique workouts per exercise
-    exercise_frequency = sets_df.groupby('exercise_name')['session_id'].nunique().sort_values(ascending=False)
-    top_15 = exercise_frequency.head(15)
-
-    fig = go.Figure(data=[
-        go.Bar(
-            x=top_15.index,
-            y=top_15.values,
-            marker_color='coral'
-        )
-    ])
+def write_figure(fig, output_path):
+    """Write a plain-dict figure spec to HTML, skipping graph_objs validation."""
+    fig['layout'].setdefault('template', DEFAULT_TEMPLATE)
+    html = pio.to_html(fig, validate=False, include_plotlyjs='directory', full_html=True)
 
-    fig.update_layout(
-        title='Top 15 Most Frequent Exercises (by # of workouts)',
-        xaxis_title='Exercise',
-        yaxis_title='Number of Workouts',
-        hovermode='x unified'
-    )
+    # Encode a slice at a time so a full bytes copy of the page never
+    # sits in memory next to the str
+    with open(output_path, 'wb', buffering=WRITE_CHUNK_SIZE) as f:
+        for start in range(0, len(html), WRITE_CHUNK_SIZE):
+            f.write(html[start:start + WRITE_CHUNK_SIZE].encode('utf-8'))
 
-    output_path = output_dir / 'exercise_frequency.html'
-    fig.write_html(output_path)
-    print(f"   Saved: {output_path}")
+
+def write_plotlyjs_bundle(output_dir):
+    """Write plotly.min.js next to the charts once, for them all to share."""
+    bundle_path = output_dir / 'plotly.min.js'
+    if not bundle_path.exists():
+        bundle_path.write_text(get_plotlyjs(), encoding='utf-8')
 
 
-def generate_summary_stats(sets_df, workouts_df, output_dir):
+def generate_top_exercises_by_volume(per_exercise, output_dir):
+    """Generate bar chart of top 10 exercises by total volume."""
+    volume = per_exercise['volume'].to_numpy()
+    top_10 = top_k_indices(volume, 10)
+
+    fig = {
+        'data': [{
+            'type': 'bar',
+            'x': np.asarray(per_exercise.index[top_10]),
+            'y': volume[top_10],
+            'marker': {'color': 'indianred'}
+        }],
+        'layout': {
+            'title': {'text': 'Top 10 Exercises by Total Volume (reps × weight)'},
+            'xaxis': {'title': {'text': 'Exercise'}},
+            'yaxis': {'title': {'text': 'Total Volume'}},
+            'hovermode': 'x unified'
+        }
+    }
+
+    output_path = output_dir / 'top_exercises_by_volume.html'
+    write_figure(fig, output_path)
+    return output_path
+
+
+def generate_workout_frequency(weekly_counts, output_dir):
+    """Generate chart showing workout frequency over time (None if undated)."""
+    if weekly_counts is None:
+        return None
+
+    fig = {
+        'data': [{
+            'type': 'bar',
+            'x': weekly_counts['week'].to_numpy(),
+            'y': weekly_counts['count'].to_numpy(),
+            'marker': {'color': 'lightseagreen'}
+        }],
+        'layout': {
+            'title': {'text': 'Workouts Per Week'},
+            'xaxis': {'title': {'text': 'Week (starting Monday)'}},
+            'yaxis': {'title': {'text': 'Number of Workouts'}},
+            'hovermode': 'x unified'
+        }
+    }
+
+    output_path = output_dir / 'workout_frequency.html'
+    write_figure(fig, output_path)
+    return output_path
+
+
+def generate_exercise_progression(progression, output_dir):
+    """Generate line chart showing volume progression for top 5 exercises (None if undated)."""
+    if progression is None:
+        return None
+
+    # One WebGL line per exercise
+    traces = []
+    for exercise, group in progression.groupby('exercise_name', sort=False, observed=True):
+        traces.append({
+            'type': 'scattergl',
+            'mode': 'lines',
+            'name': exercise,
+            'x': group['session_date'].to_numpy(),
+            'y': group['volume'].to_numpy()
+        })
+
+    fig = {
+        'data': traces,
+        'layout': {
+            'title': {'text': 'Exercise Volume Progression Over Time (Top 5 Exercises)'},
+            'xaxis': {'title': {'text': 'Date'}},
+            'yaxis': {'title': {'text': 'Volume (reps × weight)'}},
+            'legend': {'title': {'text': 'Exercise'}},
+            'hovermode': 'x unified'
+        }
+    }
+
+    output_path = output_dir / 'exercise_progression.html'
+    write_figure(fig, output_path)
+    return output_path
+
+
+def generate_sets_distribution(sets_per_workout, output_dir):
+    """Generate histogram showing distribution of sets per workout."""
+    fig = {
+        'data': [{
+            'type': 'histogram',
+            'x': sets_per_workout.to_numpy(),
+            'marker': {'color': 'mediumpurple'},
+            'nbinsx': 20
+        }],
+        'layout': {
+            'title': {'text': 'Distribution of Sets Per Workout'},
+            'xaxis': {'title': {'text': 'Number of Sets'}},
+            'yaxis': {'title': {'text': 'Number of Workouts'}},
+            'showlegend': False
+        }
+    }
+
+    output_path = output_dir / 'sets_distribution.html'
+    write_figure(fig, output_path)
+    return output_path
+
+
+def generate_exercise_frequency(per_exercise, output_dir):
+    """Generate bar chart showing top 15 most frequent exercises."""
+    # Count unique workouts per exercise
+    workouts = per_exercise['workouts'].to_numpy()
+    top_15 = top_k_indices(workouts, 15)
+
+    fig = {
+        'data': [{
+            'type': 'bar',
+            'x': np.asarray(per_exercise.index[top_15]),
+            'y': workouts[top_15],
+            'marker': {'color': 'coral'}
+        }],
+        'layout': {
+            'title': {'text': 'Top 15 Most Frequent Exercises (by # of workouts)'},
+            'xaxis': {'title': {'text': 'Exercise'}},
+            'yaxis': {'title': {'text': 'Number of Workouts'}},
+            'hovermode': 'x unified'
+        }
+    }
+
+    output_path = output_dir / 'exercise_frequency.html'
+    write_figure(fig, output_path)
+    return output_path
+
+
+def subplot_title(text, x, y):
+    """Build the annotation make_subplots would add above a 2x2 grid cell."""
+    return {
+        'text': text,
+        'x': x,
+        'y': y,
+        'xref': 'paper',
+        'yref': 'paper',
+        'xanchor': 'center',
+        'yanchor': 'bottom',
+        'showarrow': False,
+        'font': {'size': 16}
+    }
+
+
+def generate_summary_stats(summary, per_exercise, output_dir):
     """Generate a summary dashboard with key statistics."""
-    print("6. Generating summary dashboard...")
-
-    # Calculate statistics
-    total_workouts = sets_df['session_id'].nunique()
-    total_sets = len(sets_df)
-    total_exercises = sets_df['exercise_name'].nunique()
-    total_volume = sets_df['volume'].sum()
-    avg_sets_per_workout = total_sets / total_workouts if total_workouts > 0 else 0
-
-    # Create subplots
-    fig = make_subplots(
-        rows=2, cols=2,
-        subplot_titles=(
-            'Total Volume by Exercise Type',
-            'Average Reps by Exercise',
-            'Weight Distribution',
-            'Sets Over Time'
-        ),
-        specs=[[{'type': 'pie'}, {'type': 'bar'}],
-               [{'type': 'histogram'}, {'type': 'scatter'}]]
-    )
+    traces = []
 
     # 1. Volume by exercise (pie chart - top 10)
-    exercise_volume = sets_df.groupby('exercise_name')['volume'].sum().nlargest(10)
-    fig.add_trace(
-        go.Pie(labels=exercise_volume.index, values=exercise_volume.values, name='Volume'),
-        row=1, col=1
-    )
+    volume = per_exercise['volume'].to_numpy()
+    top_volume = top_k_indices(volume, 10)
+    traces.append({
+        'type': 'pie',
+        'labels': np.asarray(per_exercise.index[top_volume]),
+        'values': volume[top_volume],
+        'name': 'Volume',
+        'domain': {'x': [0.0, 0.45], 'y': [0.625, 1.0]}
+    })
 
     # 2. Average reps by exercise (bar chart - top 10)
-    avg_reps = sets_df.groupby('exercise_name')['reps'].mean().nlargest(10)
-    fig.add_trace(
-        go.Bar(x=avg_reps.index, y=avg_reps.values, name='Avg Reps', marker_color='lightblue'),
-        row=1, col=2
-    )
-
-    # 3. Weight distribution (histogram)
-    weights = sets_df[sets_df['weight'] > 0]['weight']
-    fig.add_trace(
-        go.Histogram(x=weights, name='Weight', marker_color='lightgreen'),
-        row=2, col=1
-    )
+    avg_reps = per_exercise['avg_reps'].to_numpy()
+    top_reps = top_k_indices(avg_reps, 10)
+    traces.append({
+        'type': 'bar',
+        'x': np.asarray(per_exercise.index[top_reps]),
+        'y': avg_reps[top_reps],
+        'name': 'Avg Reps',
+        'marker': {'color': 'lightblue'},
+        'xaxis': 'x',
+        'yaxis': 'y'
+    })
+
+    # 3. Weight distribution (pre-binned histogram)
+    # Bins are evenly spaced; round away arithmetic noise before it reaches the hover labels
+    edges = summary['weight_edges']
+    traces.append({
+        'type': 'bar',
+        'x': np.round((edges[:-1] + edges[1:]) / 2, 6),
+        'y': summary['weight_counts'],
+        'width': round(float(edges[1] - edges[0]), 6),
+        'name': 'Weight',
+        'marker': {'color': 'lightgreen'},
+        'xaxis': 'x2',
+        'yaxis': 'y2'
+    })
 
     # 4. Sets over time (if date available)
-    if 'session_date' in sets_df.columns:
-        daily_sets = sets_df.groupby('session_date').size().reset_index(name='count')
-        fig.add_trace(
-            go.Scatter(x=daily_sets['session_date'], y=daily_sets['count'],
-                      mode='lines+markers', name='Sets', marker_color='orange'),
-            row=2, col=2
-        )
-
-    fig.update_layout(
-        title_text=f'Workout Summary Dashboard<br><sub>Total Workouts: {total_workouts} | Total Sets: {total_sets} | '
-                   f'Unique Exercises: {total_exercises} | Avg Sets/Workout: {avg_sets_per_workout:.1f}</sub>',
-        showlegend=False,
-        height=800
-    )
+    daily_sets = summary['daily_sets']
+    if daily_sets is not None:
+        traces.append({
+            'type': 'scattergl',
+            'x': daily_sets['session_date'].to_numpy(),
+            'y': daily_sets['count'].to_numpy(),
+            'mode': 'lines+markers',
+            'name': 'Sets',
+            'marker': {'color': 'orange'},
+            'xaxis': 'x3',
+            'yaxis': 'y3'
+        })
+
+    fig = {
+        'data': traces,
+        'layout': {
+            'title': {
+                'text': f'Workout Summary Dashboard<br><sub>Total Workouts: {summary["total_workouts"]} | '
+                        f'Total Sets: {summary["total_sets"]} | Unique Exercises: {summary["total_exercises"]} | '
+                        f'Avg Sets/Workout: {summary["avg_sets_per_workout"]:.1f}</sub>'
+            },
+            # Same 2x2 grid make_subplots lays out (pie takes the top-left domain)
+            'xaxis': {'anchor': 'y', 'domain': [0.55, 1.0]},
+            'yaxis': {'anchor': 'x', 'domain': [0.625, 1.0]},
+            'xaxis2': {'anchor': 'y2', 'domain': [0.0, 0.45]},
+            'yaxis2': {'anchor': 'x2', 'domain': [0.0, 0.375]},
+            'xaxis3': {'anchor': 'y3', 'domain': [0.55, 1.0]},
+            'yaxis3': {'anchor': 'x3', 'domain': [0.0, 0.375]},
+            'annotations': [
+                subplot_title('Total Volume by Exercise Type', 0.225, 1.0),
+                subplot_title('Average Reps by Exercise', 0.775, 1.0),
+                subplot_title('Weight Distribution', 0.225, 0.375),
+                subplot_title('Sets Over Time', 0.775, 0.375)
+            ],
+            'showlegend': False,
+            'height': 800
+        }
+    }
 
     output_path = output_dir / 'summary_dashboard.html'
-    fig.write_html(output_path)
-    print(f"   Saved: {output_path}")
+    write_figure(fig, output_path)
+    return output_path
 
 
 def main():
@@ -297,16 +673,44 @@ def main():
     # Load data
     sets_df, workouts_df = load_data(str(sets_path))
 
+    # Compute the small aggregates each chart needs, so the full sets
+    # table never has to be shipped to the worker processes
+    arrays = set_arrays(sets_df)
+    per_exercise = aggregate_by_exercise(arrays)
+    weekly_counts = aggregate_weekly_workouts(workouts_df)
+    progression = aggregate_progression(arrays, per_exercise)
+    sets_per_workout = count_sets_per_workout(arrays)
+    summary = aggregate_summary(arrays, workouts_df, per_exercise, sets_per_workout)
+
     # Generate visualizations
     print(f"\nGenerating visualizations in: {output_dir}")
     print("=" * 60)
 
-    generate_top_exercises_by_volume(sets_df, output_dir)
-    generate_workout_frequency(workouts_df, output_dir)
-    generate_exercise_progression(sets_df, output_dir)
-    generate_sets_distribution(sets_df, output_dir)
-    generate_exercise_frequency(sets_df, output_dir)
-    generate_summary_stats(sets_df, workouts_df, output_dir)
+    # Written before the workers start so they never race to create it
+    write_plotlyjs_bundle(output_dir)
+
+    jobs = [
+        ('top exercises by volume chart', generate_top_exercises_by_volume, per_exercise),
+        ('workout frequency chart', generate_workout_frequency, weekly_counts),
+        ('exercise progression chart', generate_exercise_progression, progression),
+        ('sets distribution chart', generate_sets_distribution, sets_per_workout),
+        ('exercise frequency chart', generate_exercise_frequency, per_exercise),
+        ('summary dashboard', generate_summary_stats, summary, per_exercise),
+    ]
+
+    # Each chart is built and serialized independently, so write them in
+    # parallel and report progress here in order
+    with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [executor.submit(generate, *args, output_dir) for _, generate, *args in jobs]
+
+        print()
+        for number, ((name, *_), future) in enumerate(zip(jobs, futures), start=1):
+            print(f"{number}. Generating {name}...")
+            output_path = future.result()
+            if output_path is None:
+                print("   Skipped: No date information available")
+            else:
+                print(f"   Saved: {output_path}")
 
     print("\n" + "=" * 60)
     print(f"✓ All visualizations saved to: {output_dir}")